@@ -6,6 +6,8 @@ IMPLEMENTATION NOTE:
     Avoid importing any module depending on any external package. This allows to use this module without installing
     additional packages.
 """
+import sys
+
 from . import cfg, cfgfile, log
 from .hostinfo import read_hostinfo, HostinfoError
 from .jobs import warning, persistence
@@ -50,4 +52,9 @@ def output_warning(regex: str):
 
 
 def close():
-    persistence.close()
+    try:
+        persistence.close()
+    finally:
+        client = sys.modules.get('taro.client')  # Not imported here, the shared client exists only if it was used
+        if client:
+            client.close_client()
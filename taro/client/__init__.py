@@ -1,4 +1,6 @@
-from typing import List, Tuple
+from contextlib import contextmanager
+from threading import RLock
+from typing import List, Tuple, Optional
 
 from taro import dto
 from taro.jobs.api import API_FILE_EXTENSION
@@ -6,27 +8,61 @@ from taro.jobs.job import JobInfo
 from taro.socket import SocketClient, InstanceResponse
 from taro.util import iterates
 
+_client: Optional['JobsClient'] = None
+_client_lock = RLock()
+
 
 def read_jobs_info(instance="") -> List[JobInfo]:
-    with JobsClient() as client:
+    with _shared_client() as client:
         return client.read_jobs_info(instance)
 
 
+def read_instance_ids(instance="") -> List[Tuple[str, str]]:
+    with _shared_client() as client:
+        return client.read_instance_ids(instance)
+
+
 def release_jobs(pending):
-    with JobsClient() as client:
+    with _shared_client() as client:
         client.release_jobs(pending)
 
 
 def stop_jobs(instances, interrupt: bool) -> List[Tuple[str, str]]:
-    with JobsClient() as client:
+    with _shared_client() as client:
         return client.stop_jobs(instances, interrupt)
 
 
 def read_tail(instance) -> List[Tuple[str, str, List[str]]]:
-    with JobsClient() as client:
+    with _shared_client() as client:
         return client.read_tail(instance)
 
 
+@contextmanager
+def _shared_client():
+    """
+    Provides client shared by the module functions, so the socket is not created for each call.
+    The client is used exclusively by one thread at a time and it is discarded when any error occurs,
+    as an interrupted call can leave an unread response on the socket which would be read by the next call.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = JobsClient()
+        try:
+            yield _client
+        except BaseException:
+            close_client()
+            raise
+
+
+def close_client():
+    global _client
+    with _client_lock:
+        if _client is not None:
+            client, _client = _client, None
+            client.close()
+
+
 class JobsClient(SocketClient):
 
     def __init__(self):
@@ -51,10 +87,19 @@ class JobsClient(SocketClient):
         responses = self._send_request('/job', instance=instance)
         return [_create_job_info(inst_resp) for inst_resp in responses]
 
+    def read_instance_ids(self, instance="") -> List[Tuple[str, str]]:
+        """
+        Lightweight alternative to :func:`read_jobs_info` when only identity of the instances is needed
+
+        :return: list of tuple[job-id, instance-id]
+        """
+        responses = self._send_request('/ids', instance=instance)
+        return [(resp['job_id'], resp['instance_id']) for resp in (inst_resp.response for inst_resp in responses)]
+
     def read_tail(self, instance) -> List[Tuple[str, str, List[str]]]:
         inst_responses = self._send_request('/tail', instance=instance)
         return [(resp['job_id'], resp['instance_id'], resp['data']['tail'])
-                for resp in [inst_resp.response for inst_resp in inst_responses]]
+                for resp in (inst_resp.response for inst_resp in inst_responses)]
 
     @iterates
     def release_jobs(self, pending):
@@ -77,7 +122,7 @@ class JobsClient(SocketClient):
 
         inst_responses = self._send_request('/interrupt' if interrupt else '/stop', include=instances)
         return [(resp['job_id'] + "@" + resp['instance_id'], resp['data']['result'])
-                for resp in [inst_resp.response for inst_resp in inst_responses]]
+                for resp in (inst_resp.response for inst_resp in inst_responses)]
 
 
 def _create_job_info(info_resp):
@@ -8,9 +8,6 @@ from configparser import ParsingError
 from subprocess import SubprocessError
 from typing import Dict
 
-import urllib3
-from urllib3.exceptions import HTTPError
-
 from taro import paths
 
 log = logging.getLogger(__name__)
@@ -33,6 +30,8 @@ def read_hostinfo() -> Dict[str, str]:
         host_info.update(host_info_file['const'])
 
     if 'ec2' in host_info_file:
+        from urllib3.exceptions import HTTPError  # Not imported at module level as it is slow to load
+
         try:
             _resolve_ec2_section(host_info_file['ec2'], host_info)
         except (HTTPError, SubprocessError) as e:
@@ -43,6 +42,8 @@ def read_hostinfo() -> Dict[str, str]:
 
 
 def _resolve_ec2_section(mapping, host_info):
+    import urllib3
+
     rev_mapping = {v.lower(): k for k, v in mapping.items()}
     http = urllib3.PoolManager()
 
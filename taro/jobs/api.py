@@ -2,6 +2,7 @@ import logging
 from typing import Tuple
 
 from taro import dto
+from taro.jobs.job import id_matches
 from taro.socket import SocketServer
 
 log = logging.getLogger(__name__)
@@ -39,9 +40,12 @@ class Server(SocketServer):
             return _resp_err(422, job_inst, "missing_req_api")
 
         inst_filter = req_body.get('instance')
-        if inst_filter and not self._job_instance.create_info().matches(inst_filter):
+        if inst_filter and not id_matches(job_inst[0], job_inst[1], inst_filter):
             return _resp(412, job_inst, {"reason": "instance_not_matching"})
 
+        if req_body['req']['api'] == '/ids':
+            return _resp(200, job_inst, {})  # IDs are part of each response
+
         if req_body['req']['api'] == '/job':
             info_dto = dto.to_info_dto(self._job_instance.create_info())
             return _resp(200, job_inst, {"job_info": info_dto})
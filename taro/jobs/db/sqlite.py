@@ -3,107 +3,163 @@ import json
 import logging
 import sqlite3
 from datetime import timezone
-from typing import List
+from typing import List, Iterator
 
 from taro import util, cfg, paths
 from taro.jobs.execution import ExecutionState, ExecutionError, ExecutionLifecycle
 from taro.jobs.job import JobInfo, DisabledJob
 from taro.jobs.persistence import SortCriteria
 
+try:
+    import orjson  # Optional faster JSON implementation
+except ImportError:
+    orjson = None
+
 log = logging.getLogger(__name__)
 
+_loads = orjson.loads if orjson else json.loads
+
+
+def _dumps(obj):
+    if orjson:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
 
 def create_persistence():
     db_con = sqlite3.connect(cfg.persistence_database or str(paths.sqlite_db_path(True)))
+    db_con.execute("PRAGMA journal_mode=WAL")
+    db_con.execute("PRAGMA synchronous=NORMAL")
+    db_con.execute("PRAGMA temp_store=MEMORY")
+    db_con.execute("PRAGMA cache_size=-65536")  # Max 64 MiB page cache
     sqlite_ = SQLite(db_con)
     sqlite_.check_tables_exist()
     return sqlite_
 
 
+_SORT_EXPRESSIONS = {
+    SortCriteria.CREATED: 'created',
+    SortCriteria.FINISHED: 'finished',
+    SortCriteria.TIME: 'julianday(finished) - julianday(created)',
+}
+
+# Window functions (ROW_NUMBER) are available since SQLite 3.25; older versions bundled with Python 3.6/3.7 lack them
+_WINDOW_FUNCTIONS = sqlite3.sqlite_version_info >= (3, 25, 0)
+
+_state_by_name = ExecutionState.__members__.__getitem__
+_from_timestamp = datetime.datetime.fromtimestamp
+_utc = timezone.utc
+
+
+def _to_job_info(t):
+    state_changes = ((_state_by_name(state), _from_timestamp(changed, tz=_utc)) for state, changed in _loads(t[4]))
+    lifecycle = ExecutionLifecycle(*state_changes)
+    warnings = _loads(t[6]) if t[6] else dict()
+    exec_error = ExecutionError(t[7], lifecycle.state()) if t[7] else None  # TODO more data
+    return JobInfo(t[0], t[1], lifecycle, t[5], warnings, exec_error)
+
+
 # TODO indices
 class SQLite:
 
     def __init__(self, connection):
         self._conn = connection
+        self._statements = {}
 
     def check_tables_exist(self):
         c = self._conn.cursor()
-        c.execute(''' SELECT count(name) FROM sqlite_master WHERE type='table' AND name='history' ''')
-        if c.fetchone()[0] != 1:
-            c.execute('''CREATE TABLE history
-                         (job_id text,
-                         instance_id text,
-                         created timestamp,
-                         finished timestamp,
-                         state_changed text,
-                         result text,
-                         warnings text,
-                         error text)
-                         ''')
-            c.execute('''CREATE INDEX job_id_index ON history (job_id)''')
-            c.execute('''CREATE INDEX instance_id_index ON history (instance_id)''')
-            c.execute('''CREATE INDEX finished_index ON history (finished)''')
-            log.debug('event=[table_created] table=[history]')
-            self._conn.commit()
-
-        c.execute(''' SELECT count(name) FROM sqlite_master WHERE type='table' AND name='disabled_jobs' ''')
-        if c.fetchone()[0] != 1:
-            c.execute('''CREATE TABLE disabled_jobs
-                        (job_id text,
-                        regex integer,
-                        created timestamp,
-                        expires timestamp)
-                        ''')
-            log.debug('event=[table_created] table=[disabled_jobs]')
-            self._conn.commit()
+        c.execute(''' SELECT name FROM sqlite_master
+                      WHERE type IN ('table', 'index') AND name IN ('history', 'disabled_jobs', 'created_index') ''')
+        existing = {row[0] for row in c.fetchall()}
+        if {'history', 'disabled_jobs', 'created_index'} <= existing:
+            return
+
+        with self._conn:  # Single transaction for all the tables
+            c.execute('BEGIN')  # DDL statements do not open a transaction implicitly
+            if 'history' not in existing:
+                c.execute('''CREATE TABLE history
+                             (job_id text,
+                             instance_id text,
+                             created timestamp,
+                             finished timestamp,
+                             state_changed text,
+                             result text,
+                             warnings text,
+                             error text)
+                             ''')
+                c.execute('''CREATE INDEX job_id_index ON history (job_id)''')
+                c.execute('''CREATE INDEX instance_id_index ON history (instance_id)''')
+                c.execute('''CREATE INDEX finished_index ON history (finished)''')
+                log.debug('event=[table_created] table=[history]')
+
+            if 'created_index' not in existing:  # Also added to history tables created by older versions
+                c.execute('''CREATE INDEX IF NOT EXISTS created_index ON history (created)''')  # Default sort order
+                log.debug('event=[index_created] index=[created_index]')
+
+            if 'disabled_jobs' not in existing:
+                c.execute('''CREATE TABLE disabled_jobs
+                            (job_id text,
+                            regex integer,
+                            created timestamp,
+                            expires timestamp)
+                            ''')
+                log.debug('event=[table_created] table=[disabled_jobs]')
 
     def read_jobs(self, *, id_, sort, asc, limit, last) -> List[JobInfo]:
-        def sort_exp():
-            if sort == SortCriteria.CREATED:
-                return 'created'
-            if sort == SortCriteria.FINISHED:
-                return 'finished'
-            if sort == SortCriteria.TIME:
-                return "julianday(finished) - julianday(created)"
-            raise ValueError(sort)
-
-        statment = "SELECT * FROM history"
-
-        if id_:
-            statment += " WHERE job_id = \"{id}\" OR instance_id = \"{id}\"".format(id=id_)
-        if last:
-            statment += " GROUP BY job_id HAVING ROWID = max(ROWID) "
-
-        c = self._conn.execute(statment
-                               + " ORDER BY " + sort_exp() + (" ASC" if asc else " DESC")
-                               + " LIMIT ?",
-                               (limit,))
-
-        def to_job_info(t):
-            state_changes = ((ExecutionState[state], datetime.datetime.fromtimestamp(changed, tz=timezone.utc))
-                             for state, changed in json.loads(t[4]))
-            lifecycle = ExecutionLifecycle(*state_changes)
-            warnings = json.loads(t[6]) if t[6] else dict()
-            exec_error = ExecutionError(t[7], lifecycle.state()) if t[7] else None  # TODO more data
-            return JobInfo(t[0], t[1], lifecycle, t[5], warnings, exec_error)
-
-        return [to_job_info(row) for row in c.fetchall()]
+        return list(self.iter_jobs(id_=id_, sort=sort, asc=asc, limit=limit, last=last))
+
+    def iter_jobs(self, *, id_, sort, asc, limit, last) -> Iterator[JobInfo]:
+        statement = self._select_statement(sort, asc, last, bool(id_))
+        params = (id_, id_, limit) if id_ else (limit,)
+        for row in self._conn.execute(statement, params):
+            yield _to_job_info(row)
+
+    def _select_statement(self, sort, asc, last, id_filter) -> str:
+        """
+        Same options always produce the same SQL text, so the compiled statement is reused from the statement cache
+        """
+        key = (sort, asc, last, id_filter)
+        statement = self._statements.get(key)
+        if statement:
+            return statement
+
+        try:
+            sort_exp = _SORT_EXPRESSIONS[sort]
+        except KeyError:
+            raise ValueError(sort) from None
+
+        columns = "job_id, instance_id, created, finished, state_changed, result, warnings, error"
+        where = " WHERE job_id = ? OR instance_id = ?" if id_filter else ""
+        if last and not _WINDOW_FUNCTIONS:
+            statement = "SELECT " + columns + " FROM history" + where + " GROUP BY job_id HAVING ROWID = max(ROWID)"
+        elif last:
+            # Index `job_id_index` implicitly contains rowid which makes the partitioned scan index driven
+            statement = "SELECT " + columns + " FROM (" \
+                        "SELECT *, ROW_NUMBER() OVER (PARTITION BY job_id ORDER BY rowid DESC) AS row_num " \
+                        "FROM history" + where + ") WHERE row_num = 1"
+        else:
+            statement = "SELECT " + columns + " FROM history" + where
+        statement += " ORDER BY " + sort_exp + (" ASC" if asc else " DESC") + " LIMIT ?"
+
+        self._statements[key] = statement
+        return statement
 
     def store_job(self, job_info):
-        self._conn.execute(
-            "INSERT INTO history VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-            (job_info.job_id,
-             job_info.instance_id,
-             job_info.lifecycle.changed(ExecutionState.CREATED),
-             job_info.lifecycle.last_changed(),
-             json.dumps(
-                 [(state.name, int(changed.timestamp())) for state, changed in job_info.lifecycle.state_changes()]),
-             job_info.status,
-             json.dumps(job_info.warnings),
-             job_info.exec_error.message if job_info.exec_error else None,
-             )
-        )
-        self._conn.commit()
+        self.store_jobs([job_info])
+
+    def store_jobs(self, job_infos):
+        rows = [(j.job_id,
+                 j.instance_id,
+                 j.lifecycle.changed(ExecutionState.CREATED),
+                 j.lifecycle.last_changed(),
+                 _dumps([(state.name, int(changed.timestamp())) for state, changed in j.lifecycle.state_changes()]),
+                 j.status,
+                 _dumps(j.warnings),
+                 j.exec_error.message if j.exec_error else None,
+                 )
+                for j in job_infos]
+        with self._conn:
+            self._conn.executemany("INSERT INTO history VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
 
     def add_disabled_jobs(self, disabled_jobs):
         added = []
@@ -135,4 +191,11 @@ class SQLite:
                 for row in c.fetchall()]
 
     def close(self):
-        self._conn.close()
+        try:
+            # Best effort only: refreshes planner statistics only for tables where it is worth it
+            self._conn.execute("PRAGMA busy_timeout = 100")  # Do not wait for the default 5s when the db is locked
+            self._conn.execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            log.debug("event=[optimize_skipped] detail=[%s]", e)
+        finally:
+            self._conn.close()
@@ -171,6 +171,8 @@ class OutputExecution(Execution):
 
 class ExecutionLifecycle:
 
+    __slots__ = ('_state_changes',)
+
     def __init__(self, *state_changes: Tuple[ExecutionState, datetime.datetime]):
         self._state_changes: OrderedDict[ExecutionState, datetime.datetime] = OrderedDict(state_changes)
 
@@ -237,6 +239,14 @@ class ExecutionLifecycleManagement(ExecutionLifecycle):
             self._state_changes[new_state] = utc_now()
             return True
 
+    def snapshot(self) -> ExecutionLifecycle:
+        """
+        :return: lifecycle with the current state changes which is not affected by any further state change
+        """
+        copied = ExecutionLifecycle()
+        copied._state_changes = OrderedDict(self._state_changes)
+        return copied
+
 
 class ExecutionOutputObserver(abc.ABC):
 
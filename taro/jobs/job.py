@@ -12,8 +12,11 @@ There are two type of clients of the framework:
 """
 
 import abc
+import re
 from collections import namedtuple
-from fnmatch import fnmatch
+from fnmatch import translate
+from functools import lru_cache, partial
+from operator import eq
 
 from taro.jobs.execution import ExecutionError
 
@@ -144,6 +147,8 @@ class JobInfo:
     Immutable snapshot of job instance state
     """
 
+    __slots__ = ('_job_id', '_instance_id', '_lifecycle', '_status', '_warnings', '_exec_error')
+
     def __init__(self, job_id: str, instance_id: str, lifecycle, status, warnings, exec_error: ExecutionError):
         self._job_id = job_id
         self._instance_id = instance_id
@@ -174,6 +179,10 @@ class JobInfo:
 
     @property
     def warnings(self):
+        """
+        Warning names mapped to their occurrence counts.
+        The mapping is shared with other infos of the same instance and must not be modified.
+        """
         return self._warnings
 
     @property
@@ -181,7 +190,7 @@ class JobInfo:
         return self._exec_error
 
     def matches(self, instance):
-        return fnmatch(self.job_id, instance) or fnmatch(self.instance_id, instance)
+        return id_matches(self.job_id, self.instance_id, instance)
 
     def __repr__(self) -> str:
         return "{}({!r}, {!r}, {!r}, {!r}, {!r}, {!r})".format(
@@ -189,6 +198,26 @@ class JobInfo:
             self._exec_error)
 
 
+def id_matches(job_id, instance_id, instance):
+    """
+    Same as :func:`JobInfo.matches` but usable without creating the info
+
+    :param job_id: job ID to match
+    :param instance_id: instance ID to match
+    :param instance: pattern matched against the job ID and the instance ID
+    :return: True if any of the IDs matches the pattern
+    """
+    match = _compile_pattern(instance)
+    return bool(match(job_id) or match(instance_id))
+
+
+@lru_cache(maxsize=1024)
+def _compile_pattern(pattern):
+    if not any(c in pattern for c in '*?['):  # No wildcards, plain comparison is enough
+        return partial(eq, pattern)
+    return re.compile(translate(pattern)).match
+
+
 class ExecutionStateObserver(abc.ABC):
 
     @abc.abstractmethod
@@ -55,10 +55,21 @@ def read_jobs(*, id_=None, sort=SortCriteria.CREATED, asc=False, limit=-1, last=
     return _instance().read_jobs(id_=id_, sort=sort, asc=asc, limit=limit, last=last)
 
 
+def iter_jobs(*, id_=None, sort=SortCriteria.CREATED, asc=False, limit=-1, last=False):
+    """
+    Same as :func:`read_jobs` but the jobs are lazily created as the records are fetched
+    """
+    return _instance().iter_jobs(id_=id_, sort=sort, asc=asc, limit=limit, last=last)
+
+
 def store_job(job_info):
     _instance().store_job(job_info)
 
 
+def store_jobs(job_infos):
+    _instance().store_jobs(job_infos)
+
+
 def add_disabled_jobs(disabled_jobs):
     return _instance().add_disabled_jobs(disabled_jobs)
 
@@ -90,12 +101,18 @@ def _sort_key(sort: SortCriteria):
 
 class NoPersistence:
 
-    def read_jobs(self, *, id_=None, sort, asc, limit):
+    def read_jobs(self, *, id_=None, sort, asc, limit, last):
+        raise PersistenceDisabledError()
+
+    def iter_jobs(self, *, id_=None, sort, asc, limit, last):
         raise PersistenceDisabledError()
 
     def store_job(self, job_info):
         raise PersistenceDisabledError()
 
+    def store_jobs(self, job_infos):
+        raise PersistenceDisabledError()
+
     def add_disabled_jobs(self, disabled_jobs):
         raise PersistenceDisabledError()
 
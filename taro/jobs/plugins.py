@@ -1,7 +1,6 @@
 import abc
 import importlib
 import logging
-import pkgutil
 from types import ModuleType
 from typing import Dict
 
@@ -67,13 +66,20 @@ class PluginDisabledError(Exception):
 
 
 def discover_ext_plugins(ext_prefix, names, skip_imported=True) -> Dict[str, ModuleType]:
-    discovered_names = [name for finder, name, is_pkg in pkgutil.iter_modules() if name.startswith(ext_prefix)]
+    if skip_imported:
+        names = [name for name in names if name not in PluginBase.name2subclass]  # Skip already imported
+    if not names:
+        return {}  # Nothing to import, no need to scan the path
+
+    import importlib.util  # imported here as it is not needed by processes without ext plugins
+
+    # Only the requested top-level modules are looked up instead of listing all modules on the path
+    discovered_names = {name for name in names
+                        if name.startswith(ext_prefix) and '.' not in name and importlib.util.find_spec(name)}
     log.debug("event=[ext_plugin_modules_discovered] names=[%s]", ",".join(discovered_names))
 
     name2module = {}
     for name in names:
-        if skip_imported and name in PluginBase.name2subclass.keys():
-            continue  # Already imported
         if name not in discovered_names:
             log.warning("event=[ext_plugin_module_not_found] module=[%s]", name)
             continue
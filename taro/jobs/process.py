@@ -2,10 +2,9 @@ import logging
 import sys
 import traceback
 from contextlib import contextmanager
-from multiprocessing import Queue
+from multiprocessing import Pipe, BufferTooShort
 from multiprocessing.context import Process
-from queue import Full
-from threading import Thread
+from threading import Thread, Lock, current_thread
 from typing import Union
 
 from taro import ExecutionState
@@ -19,7 +18,8 @@ class ProcessExecution(OutputExecution):
     def __init__(self, target, args):
         self.target = target
         self.args = args
-        self.output_queue = Queue(maxsize=2048)
+        self._output_rx, self._output_tx = Pipe(duplex=False)
+        self._output_buf = memoryview(bytearray(65536))
         self._process: Union[Process, None] = None
         self._status = None
         self._stopped: bool = False
@@ -37,9 +37,10 @@ class ProcessExecution(OutputExecution):
             output_reader = Thread(target=self._read_output, name='Output-Reader', daemon=True)
             output_reader.start()
             self._process.join()
-            self.output_queue.put_nowait(_QueueStop())
+            self._output_tx.send_bytes(_STOP_FRAME)  # The child process has exited, so this is the only sender left
             output_reader.join(timeout=1)
-            self.output_queue.close()
+            self._output_tx.close()
+            self._output_rx.close()
             if self._process.exitcode == 0:
                 return ExecutionState.COMPLETED
         if self._stopped:
@@ -49,27 +50,33 @@ class ProcessExecution(OutputExecution):
         raise ExecutionError("Process returned non-zero code " + str(self._process.exitcode), ExecutionState.FAILED)
 
     def _run(self):
-        with self._capture_stdout():
+        lock = Lock()  # Guards all sends to the output pipe from this process as frames must not interleave
+        with self._capture_stdout(lock):
             try:
                 self.target(*self.args)
             except:
-                for line in traceback.format_exception(*sys.exc_info()):
-                    self.output_queue.put_nowait(line)
+                sys.stdout.flush()
+                sys.stderr.flush()
+                with lock:
+                    for line in traceback.format_exception(*sys.exc_info()):
+                        _send_line(self._output_tx, line)
                 raise
 
     @contextmanager
-    def _capture_stdout(self):
+    def _capture_stdout(self, lock):
         import sys
         original_stdout = sys.stdout
         original_stderr = sys.stderr
-        stdout_writer = _CapturingWriter(original_stdout, self.output_queue)
-        stderr_writer = _CapturingWriter(original_stderr, self.output_queue)
+        stdout_writer = _CapturingWriter(original_stdout, self._output_tx, lock)
+        stderr_writer = _CapturingWriter(original_stderr, self._output_tx, lock)
         sys.stdout = stdout_writer
         sys.stderr = stderr_writer
 
         try:
             yield
         finally:
+            stdout_writer.flush_all()
+            stderr_writer.flush_all()
             sys.stdout = original_stdout
             sys.stderr = original_stderr
 
@@ -94,10 +101,22 @@ class ProcessExecution(OutputExecution):
         self._output_observers.remove(observer)
 
     def _read_output(self):
+        buf = self._output_buf
         while True:
-            output_text = self.output_queue.get()
-            if isinstance(output_text, _QueueStop):
+            try:
+                size = self._output_rx.recv_bytes_into(buf)
+                frame = buf[:size]
+            except BufferTooShort as e:
+                frame = e.args[0]  # Exceptionally long line
+            except (EOFError, OSError) as e:
+                log.debug("event=[output_pipe_closed] detail=[%s]", e)
+                break
+            except Exception as e:
+                log.warning("event=[invalid_output_frame] detail=[%s]", e)
                 break
+            if not frame:
+                break  # Stop frame
+            output_text = str(frame, 'utf-8', 'replace')
             self._status = output_text
             self._notify_output_observers(output_text)
 
@@ -116,22 +135,62 @@ class ProcessExecution(OutputExecution):
 
 
 class _CapturingWriter:
+    """
+    Forwards written text to the original stream and sends it to the output pipe line by line.
+    Text without a line terminator is kept in the buffer of the writing thread until the line is completed,
+    the buffer size limit is reached or the writer is flushed. The buffers are separated per thread, so unfinished
+    lines of different threads are never joined. All buffer changes and sends are guarded by the shared lock.
+    """
+
+    BUFFER_LIMIT = 8192
 
-    def __init__(self, out, output_queue):
+    def __init__(self, out, output_conn, lock):
         self.out = out
-        self.output_queue = output_queue
+        self.output_conn = output_conn
+        self._lock = lock
+        self._bufs = {}  # Thread -> unfinished line parts
+        self._sizes = {}  # Thread -> length of the unfinished line
 
     def write(self, text):
-        text_s = text.rstrip()
-        if text_s:
-            try:
-                self.output_queue.put_nowait(text_s)
-            except Full:
-                # TODO what to do here?
-                log.warning("event=[output_queue_full]")
+        with self._lock:
+            thread = current_thread()  # Not ident, which can be reused by a new thread while a line is unfinished
+            buf = self._bufs.setdefault(thread, [])
+            buf.append(text)
+            size = self._sizes.get(thread, 0) + len(text)
+            if '\n' in text or size > self.BUFFER_LIMIT:
+                *lines, partial = ''.join(buf).split('\n')
+                if len(partial) > self.BUFFER_LIMIT:
+                    lines.append(partial)
+                    partial = ''
+                buf[:] = [partial] if partial else []
+                size = len(partial)
+                for line in lines:
+                    _send_line(self.output_conn, line)
+            self._sizes[thread] = size
         self.out.write(text)
 
+    def flush(self):
+        with self._lock:
+            self._send_buffered(current_thread())
+        self.out.flush()
+
+    def flush_all(self):
+        with self._lock:
+            for thread in list(self._bufs):
+                self._send_buffered(thread)
+        self.out.flush()
+
+    def _send_buffered(self, thread):
+        self._sizes.pop(thread, None)
+        buf = self._bufs.pop(thread, None)
+        if buf:
+            _send_line(self.output_conn, ''.join(buf))
+
+
+def _send_line(conn, line):
+    line_s = line.rstrip()
+    if line_s:  # Never send an empty frame as it is reserved for the stop signal
+        conn.send_bytes(line_s.encode('utf-8', errors='replace'))
+
 
-class _QueueStop:
-    """Poison object signalizing no more objects will be put in the queue"""
-    pass
+_STOP_FRAME = b''  # Signalizing no more output will be sent through the pipe
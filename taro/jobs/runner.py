@@ -1,18 +1,18 @@
 """
 Implementation of job management framework based on :mod:`job` module.
 """
-import copy
 import logging
 import re
-from collections import deque, Counter
+from collections import deque
 from threading import Lock, Event, RLock
-from typing import List, Union, Optional, Callable
+from typing import Union, Optional, Callable, Tuple
 
 import taro.client
 from taro import util
 from taro.err import IllegalStateError
 from taro.jobs import persistence
-from taro.jobs.execution import ExecutionError, ExecutionState, ExecutionLifecycleManagement, ExecutionOutputObserver
+from taro.jobs.execution import ExecutionError, ExecutionState, ExecutionLifecycle, ExecutionLifecycleManagement, \
+    ExecutionOutputObserver
 from taro.jobs.job import ExecutionStateObserver, JobInstance, JobInfo, WarningObserver, JobOutputObserver, Warn, \
     WarnEventCtx
 
@@ -33,6 +33,7 @@ class RunnerJobInstance(JobInstance, ExecutionOutputObserver):
         self._no_overlap = no_overlap
         self._instance_id: str = util.unique_timestamp_hex()
         self._lifecycle: ExecutionLifecycleManagement = ExecutionLifecycleManagement()
+        self._lifecycle_snapshot: Optional[ExecutionLifecycle] = None  # Shared by infos until the state changes
         self._last_output = deque(maxlen=10)
         self._exec_error = None
         self._executing = False
@@ -41,10 +42,13 @@ class RunnerJobInstance(JobInstance, ExecutionOutputObserver):
         self._state_lock: RLock = RLock()
         self._latch: Optional[Event] = None
         self._latch_wait_state: Optional[ExecutionState] = None
-        self._warnings = Counter()
-        self._state_observers = []
-        self._warning_observers = []
-        self._output_observers = []
+        self._warnings = {}
+        self._warnings_snapshot: Optional[dict] = None  # Shared read-only by infos until a new warning is added
+        # Observer sequences are immutable (copy on write) so they can be iterated without copying
+        self._state_observers = ()
+        self._warning_observers = ()
+        self._output_observers = ()
+        self._notify_cache = {}  # kind -> (instance observers, global observers, notify functions of both)
 
         self._state_change(ExecutionState.CREATED)
 
@@ -84,8 +88,8 @@ class RunnerJobInstance(JobInstance, ExecutionOutputObserver):
         return self._execution.status
 
     @property
-    def last_output(self) -> List[str]:
-        return list(self._last_output)
+    def last_output(self) -> Tuple[str, ...]:
+        return tuple(self._last_output)
 
     @property
     def warnings(self):
@@ -97,27 +101,30 @@ class RunnerJobInstance(JobInstance, ExecutionOutputObserver):
 
     def create_info(self):
         with self._state_lock:
-            return JobInfo(
-                self.job_id, self.instance_id, copy.deepcopy(self._lifecycle), self.status, self.warnings,
-                self.exec_error)
+            if self._lifecycle_snapshot is None:
+                self._lifecycle_snapshot = self._lifecycle.snapshot()
+            if self._warnings_snapshot is None:
+                self._warnings_snapshot = self.warnings
+            return JobInfo(self.job_id, self.instance_id, self._lifecycle_snapshot, self.status,
+                           self._warnings_snapshot, self.exec_error)
 
     def add_state_observer(self, observer):
-        self._state_observers.append(observer)
+        self._state_observers = _added(self._state_observers, observer)
 
     def remove_state_observer(self, observer):
-        self._state_observers.remove(observer)
+        self._state_observers = _removed(self._state_observers, observer)
 
     def add_warning_observer(self, observer):
-        self._warning_observers.append(observer)
+        self._warning_observers = _added(self._warning_observers, observer)
 
     def remove_warning_observer(self, observer):
-        self._warning_observers.remove(observer)
+        self._warning_observers = _removed(self._warning_observers, observer)
 
     def add_output_observer(self, observer):
-        self._output_observers.append(observer)
+        self._output_observers = _added(self._output_observers, observer)
 
     def remove_output_observer(self, observer):
-        self._output_observers.remove(observer)
+        self._output_observers = _removed(self._output_observers, observer)
 
     def stop(self):
         """
@@ -148,16 +155,19 @@ class RunnerJobInstance(JobInstance, ExecutionOutputObserver):
             self._execution.interrupt()
 
     def add_warning(self, warning):
-        self._warnings.update([warning.name])
+        with self._state_lock:
+            count = self._warnings.get(warning.name, 0) + 1
+            self._warnings[warning.name] = count
+            self._warnings_snapshot = None
         log.warning('event=[new_warning] warning=[%s]', warning)
-        self._notify_warning_observers(self.create_info(), warning, WarnEventCtx(self._warnings[warning.name]))  # Lock?
+        self._notify_warning_observers(self.create_info(), warning, WarnEventCtx(count))
 
     def run(self):
-        if persistence.is_enabled():
-            for disabled in persistence.read_disabled_jobs():
-                if (disabled.regex and re.compile(disabled.job_id).match(self.job_id)) or disabled.job_id == self.job_id:
-                    self._state_change(ExecutionState.DISABLED)
-                    return
+        if persistence.is_enabled() and any(
+                disabled.job_id == self.job_id or (disabled.regex and re.match(disabled.job_id, self.job_id))
+                for disabled in persistence.read_disabled_jobs()):
+            self._state_change(ExecutionState.DISABLED)
+            return
 
         if self._latch and not self._stopped_or_interrupted:
             self._state_change(self._latch_wait_state)  # TODO Race condition?
@@ -173,12 +183,12 @@ class RunnerJobInstance(JobInstance, ExecutionOutputObserver):
             return
 
         try:
-            if self._no_overlap and any(j for j in taro.client.read_jobs_info()
-                                        if j.job_id == self.job_id and j.instance_id != self._instance_id):
+            if self._no_overlap and any(job_id == self.job_id and instance_id != self._instance_id
+                                        for job_id, instance_id in taro.client.read_instance_ids()):
                 self._state_change(ExecutionState.SKIPPED)
                 return
         except Exception as e:
-            log.warning("event=[read_jobs_info_error] error=[%s]", e)
+            log.warning("event=[read_instance_ids_error] error=[%s]", e)
 
         self._state_change(ExecutionState.TRIGGERED if self._execution.is_async else ExecutionState.RUNNING)
         try:
@@ -189,102 +199,144 @@ class RunnerJobInstance(JobInstance, ExecutionOutputObserver):
             self._state_change(exec_error.exec_state, exec_error)
 
     # Inline?
-    def _log(self, event: str, msg: str):
-        return "event=[{}] job_id=[{}] instance_id=[{}] {}".format(event, self._job_id, self._instance_id, msg)
+    def _log(self, event: str, msg: str, *args):
+        """
+        :return: logging arguments, the message is formatted by the logger only if the record is emitted
+        """
+        return ("event=[%s] job_id=[%s] instance_id=[%s] " + msg, event, self._job_id, self._instance_id) + args
 
     def _state_change(self, new_state, exec_error: ExecutionError = None):
         # It is not necessary to lock all this code, but it would be if this method is not confined to one thread
         # However locking is still needed for correct creation of job info when job_info method is called (anywhere)
         job_info = None
+        store = new_state.is_terminal() and persistence.is_enabled()
         with self._state_lock:
             if exec_error:
                 self._exec_error = exec_error
                 if exec_error.exec_state == ExecutionState.ERROR or exec_error.unexpected_error:
-                    log.exception(self._log('job_error', "reason=[{}]".format(exec_error)), exc_info=True)
+                    log.exception(*self._log('job_error', "reason=[%s]", exec_error), exc_info=True)
                 else:
-                    log.warning(self._log('job_not_completed', "reason=[{}]".format(exec_error)))
+                    log.warning(*self._log('job_not_completed', "reason=[%s]", exec_error))
 
             prev_state = self._lifecycle.state()
             if self._lifecycle.set_state(new_state):
+                self._lifecycle_snapshot = None
                 level = logging.WARN if new_state.is_failure() or new_state.is_unexecuted() else logging.INFO
-                log.log(level, self._log('job_state_changed', "prev_state=[{}] new_state=[{}]".format(
-                    prev_state.name, new_state.name)))
-                job_info = self.create_info()  # Be sure both new_state and exec_error are already set
+                log.log(level, *self._log('job_state_changed', "prev_state=[%s] new_state=[%s]",
+                                          prev_state.name, new_state.name))
+                if store or self._state_observers or _state_observers:  # No info needed if no one consumes it
+                    job_info = self.create_info()  # Be sure both new_state and exec_error are already set
 
         if job_info:
-            if new_state.is_terminal() and persistence.is_enabled():
+            if store:
                 persistence.store_job(job_info)
             self._notify_state_observers(job_info)
 
     def _notify_state_observers(self, job_info: JobInfo):
-        for observer in (self._state_observers + _state_observers):
+        for notify in _notify_functions(self._notify_cache, 'state',
+                                        self._state_observers, _state_observers):
             # noinspection PyBroadException
             try:
-                if isinstance(observer, ExecutionStateObserver):
-                    observer.state_update(job_info)
-                elif callable(observer):
-                    observer(job_info)
-                else:
-                    log.warning("event=[unsupported_state_observer] observer=[%s]", observer)
+                notify(job_info)
             except BaseException:
                 log.exception("event=[state_observer_exception]")
 
     def _notify_warning_observers(self, job_info: JobInfo, warning: Warn, event_ctx: WarnEventCtx):
-        for observer in (self._warning_observers + _warning_observers):
+        for notify in _notify_functions(self._notify_cache, 'warning',
+                                        self._warning_observers, _warning_observers):
             # noinspection PyBroadException
             try:
-                if isinstance(observer, WarningObserver):
-                    observer.new_warning(job_info, warning, event_ctx)
-                elif callable(observer):
-                    observer(job_info, warning, event_ctx)
-                else:
-                    log.warning("event=[unsupported_warning_observer] observer=[%s]", observer)
+                notify(job_info, warning, event_ctx)
             except BaseException:
                 log.exception("event=[warning_observer_exception]")
 
     def output_update(self, output):
         """Executed when new output line is available"""
         self._last_output.append(output)
-        self._notify_output_observers(self.create_info(), output)
+        if self._output_observers or _output_observers:  # Skip the info (and its lock) when nobody listens
+            self._notify_output_observers(self.create_info(), output)
 
     def _notify_output_observers(self, job_info: JobInfo, output):
-        for observer in (self._output_observers + _output_observers):
+        for notify in _notify_functions(self._notify_cache, 'output',
+                                        self._output_observers, _output_observers):
             # noinspection PyBroadException
             try:
-                if isinstance(observer, JobOutputObserver):
-                    observer.output_update(job_info, output)
-                elif callable(observer):
-                    observer(job_info, output)
-                else:
-                    log.warning("event=[unsupported_output_observer] observer=[%s]", observer)
+                notify(job_info, output)
             except BaseException:
                 log.exception("event=[output_observer_exception]")
 
 
-_state_observers: List[Union[ExecutionStateObserver, Callable]] = []
-_warning_observers: List[Union[WarningObserver, Callable]] = []
-_output_observers: List[Union[JobOutputObserver, Callable]] = []
+_state_observers: Tuple[Union[ExecutionStateObserver, Callable], ...] = ()
+_warning_observers: Tuple[Union[WarningObserver, Callable], ...] = ()
+_output_observers: Tuple[Union[JobOutputObserver, Callable], ...] = ()
+
+
+def _added(observers, observer):
+    return observers + (observer,)
+
+
+def _removed(observers, observer):
+    i = observers.index(observer)  # ValueError if not registered, same as list.remove
+    return observers[:i] + observers[i + 1:]
+
+
+_OBSERVER_TYPES = {
+    'state': (ExecutionStateObserver, 'state_update'),
+    'warning': (WarningObserver, 'new_warning'),
+    'output': (JobOutputObserver, 'output_update'),
+}
+
+
+def _notify_functions(cache, kind, instance_observers, global_observers):
+    """
+    Resolves how each observer is notified only when any of the observer tuples is replaced (they are copy on write)
+
+    :return: tuple of functions to call with the notification arguments
+    """
+    cached = cache.get(kind)
+    if cached and cached[0] is instance_observers and cached[1] is global_observers:
+        return cached[2]
+    observer_type, method = _OBSERVER_TYPES[kind]
+    notify_functions = tuple(filter(None, (_notify_function(kind, observer_type, method, observer)
+                                           for observer in instance_observers + global_observers)))
+    cache[kind] = (instance_observers, global_observers, notify_functions)
+    return notify_functions
+
+
+def _notify_function(kind, observer_type, method, observer):
+    if isinstance(observer, observer_type):
+        return getattr(observer, method)
+    if callable(observer):
+        return observer
+    log.warning("event=[unsupported_%s_observer] observer=[%s]", kind, observer)
+    return None
 
 
 def register_state_observer(observer):
-    _state_observers.append(observer)
+    global _state_observers
+    _state_observers = _added(_state_observers, observer)
 
 
 def deregister_state_observer(observer):
-    _state_observers.remove(observer)
+    global _state_observers
+    _state_observers = _removed(_state_observers, observer)
 
 
 def register_warning_observer(observer):
-    _warning_observers.append(observer)
+    global _warning_observers
+    _warning_observers = _added(_warning_observers, observer)
 
 
 def deregister_warning_observer(observer):
-    _warning_observers.remove(observer)
+    global _warning_observers
+    _warning_observers = _removed(_warning_observers, observer)
 
 
 def register_output_observer(observer):
-    _output_observers.append(observer)
+    global _output_observers
+    _output_observers = _added(_output_observers, observer)
 
 
 def deregister_output_observer(observer):
-    _output_observers.remove(observer)
+    global _output_observers
+    _output_observers = _removed(_output_observers, observer)
@@ -45,10 +45,10 @@ class _OutputMatchesWarning(JobOutputObserver):
         self.job_instance = job_instance
         self.id = w_id
         self.regex = re.compile(regex)
+        self._search = self.regex.search  # Bound once as it is called for every output line
 
     def output_update(self, _, output):
-        m = self.regex.search(output)
-        if m:
+        if self._search(output):
             warn = Warn(self.id, {'matches': output})
             self.job_instance.add_warning(warn)
 
@@ -3,7 +3,7 @@ import logging
 
 from taro import util, dto
 from taro.jobs.events import STATE_LISTENER_FILE_EXTENSION, OUTPUT_LISTENER_FILE_EXTENSION
-from taro.jobs.job import ExecutionStateObserver
+from taro.jobs.job import ExecutionStateObserver, id_matches
 from taro.socket import SocketServer
 
 log = logging.getLogger(__name__)
@@ -13,6 +13,10 @@ def _listener_socket_name(ext):
     return util.unique_timestamp_hex() + ext
 
 
+def _is_filtered_out(instance, info_dto):
+    return instance and not id_matches(info_dto['job_id'], info_dto['instance_id'], instance)
+
+
 class StateReceiver(SocketServer):
 
     def __init__(self, instance="", states=()):
@@ -22,9 +26,10 @@ class StateReceiver(SocketServer):
         self.listeners = []
 
     def handle(self, req_body):
-        job_info = dto.to_job_info(req_body['event']['job_info'])
-        if self.instance and not job_info.matches(self.instance):
+        info_dto = req_body['event']['job_info']
+        if _is_filtered_out(self.instance, info_dto):
             return
+        job_info = dto.to_job_info(info_dto)
         if self.states and job_info.state not in self.states:
             return
         for listener in self.listeners:
@@ -44,9 +49,10 @@ class OutputReceiver(SocketServer):
         self.listeners = []
 
     def handle(self, req_body):
-        job_info = dto.to_job_info(req_body['event']['job_info'])
-        if self.instance and not job_info.matches(self.instance):
+        info_dto = req_body['event']['job_info']
+        if _is_filtered_out(self.instance, info_dto):
             return
+        job_info = dto.to_job_info(info_dto)
         output = req_body['event']['output']
         for listener in self.listeners:
             listener.output_update(job_info, output)
@@ -10,8 +10,16 @@ from typing import List
 
 from taro import paths
 
+try:
+    import orjson  # Optional faster JSON implementation
+except ImportError:
+    orjson = None
+
 log = logging.getLogger(__name__)
 
+_encode = json.JSONEncoder(separators=(',', ':')).encode
+_decode = orjson.loads if orjson else json.loads  # Both accept the raw datagram bytes
+
 
 class SocketServer(abc.ABC):
 
@@ -44,12 +52,12 @@ class SocketServer(abc.ABC):
             datagram, client_address = self._server.recvfrom(16384)
             if not datagram:
                 break
-            req_body = json.loads(datagram)
+            req_body = _decode(datagram)
             resp_body = self.handle(req_body)
 
             if resp_body:
                 if client_address:
-                    self._server.sendto(json.dumps(resp_body).encode(), client_address)
+                    self._server.sendto(_encode(resp_body).encode(), client_address)
                 else:
                     log.warning('event=[missing_client_address]')
         log.debug('event=[server_stopped]')
@@ -95,6 +103,7 @@ class SocketClient:
     @coroutine
     def servers(self, include=()):
         req_body = '_'  # Dummy initialization to remove warnings
+        encoded_body, encoded_req = None, None
         resp = None
         skip = False
         for api_file in paths.socket_files(self._file_extension):
@@ -107,11 +116,13 @@ class SocketClient:
                 skip = False  # reset
                 if not req_body:
                     break  # next(this) called -> proceed to the next server
+                if req_body is not encoded_body:  # The same request is usually sent to all servers
+                    encoded_body, encoded_req = req_body, _encode(req_body).encode()
                 try:
-                    self._client.sendto(json.dumps(req_body).encode(), str(api_file))
+                    self._client.sendto(encoded_req, str(api_file))
                     if self._bidirectional:
                         datagram = self._client.recv(16384)
-                        resp = InstanceResponse(instance_id, json.loads(datagram.decode()))
+                        resp = InstanceResponse(instance_id, _decode(datagram))
                 except ConnectionRefusedError:  # TODO what about other errors?
                     log.warning('event=[dead_socket] socket=[{}]'.format(api_file))
                     self.dead_sockets.append(api_file)
@@ -1,12 +1,12 @@
 import functools
+import heapq
 import os
-import secrets
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from shutil import copy
 from typing import Dict
 
-import itertools
 import yaml
 
 from taro import utilns
@@ -38,50 +38,66 @@ def iterates(func):
 
 
 def unique_timestamp_hex(random_suffix_length=4):
-    return secrets.token_hex(random_suffix_length) + format(int(datetime.utcnow().timestamp() * 1000000), 'x')[::-1]
+    return os.urandom(random_suffix_length).hex() + format(int(time.time() * 1000000), 'x')[::-1]
 
 
 def utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+_fromisoformat = getattr(datetime, 'fromisoformat', None)  # Python 3.7+
+
+
 def dt_from_utc_str(str_ts, is_iso=True):
     if not str_ts:
         return None
     sep = "T" if is_iso else " "
 
+    # Fast path for strings produced by `isoformat()` or `str()` of an aware datetime; strptime is much slower
+    if _fromisoformat and str_ts[10:11] == sep:
+        try:
+            dt = _fromisoformat(str_ts)
+            if dt.tzinfo:
+                return dt
+        except ValueError:
+            pass
+
     # Workaround: https://stackoverflow.com/questions/30999230/how-to-parse-timezone-with-colon to support Python <3.7
     if ":" == str_ts[-3:-2]:
         str_ts = str_ts[:-3] + str_ts[-2:]
 
-    return datetime.strptime(str_ts, "%Y-%m-%d" + sep + "%H:%M:%S.%f%z")
+    # Fraction is omitted by `isoformat()` and `str()` when microseconds are zero
+    time_format = "%H:%M:%S.%f%z" if "." in str_ts else "%H:%M:%S%z"
+    return datetime.strptime(str_ts, "%Y-%m-%d" + sep + time_format)
 
 
 def format_timedelta(td):
-    mm, ss = divmod(td.seconds, 60)
-    hh, mm = divmod(mm, 60)
-    s = "%02d:%02d:%02d" % (hh, mm, ss)
+    hh, rem = divmod(td.seconds, 3600)
+    mm, ss = divmod(rem, 60)
+    s = f"{hh:02d}:{mm:02d}:{ss:02d}"
     if td.days:
-        def plural(n):
-            return n, abs(n) != 1 and "s" or ""
-
-        s = ("%d day%s, " % plural(td.days)) + s
+        s = f"{td.days} day{'s' if abs(td.days) != 1 else ''}, {s}"
     if td.microseconds:
-        s = s + ".%06d" % td.microseconds
-        # s = s + ("%f" % (td.microseconds / 1000000))[1:-3]
+        s = f"{s}.{td.microseconds:06d}"
     return s
 
 
 def sequence_view(seq, *, sort_key, asc, limit):
-    sorted_seq = sorted(seq, key=sort_key, reverse=not asc)
-    return itertools.islice(sorted_seq, 0, limit if limit > 0 else None)
+    if limit > 0:  # Partial sort, same result as sorting the whole sequence and taking the first `limit` items
+        return iter((heapq.nsmallest if asc else heapq.nlargest)(limit, seq, key=sort_key))
+    return iter(sorted(seq, key=sort_key, reverse=not asc))
 
 
 def expand_user(file):
     if not isinstance(file, str) or not file.startswith('~'):
         return file
 
-    return os.path.expanduser(file)
+    return _expand_user(file)
+
+
+@functools.lru_cache(maxsize=64)
+def _expand_user(file):
+    return os.path.expanduser(file)  # Home directory is not expected to change during the process lifetime
 
 
 def print_file(path):
@@ -91,9 +107,24 @@ def print_file(path):
         print(file.read())
 
 
+_yaml_cache = {}  # file path -> (mtime_ns, size, parsed content)
+
+
 def read_yaml_file(file_path) -> NestedNamespace:
-    with open(file_path, 'r') as file:
-        return utilns.wrap_namespace(yaml.safe_load(file))
+    """
+    Parsed content is cached and reused until the modification time or the size of the file changes.
+    A new namespace is created for each call so the returned object can be modified by the caller.
+    """
+    stat = os.stat(file_path)
+    cached = _yaml_cache.get(file_path)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        content = cached[2]
+    else:
+        with open(file_path, 'rb') as file:
+            content = yaml.safe_load(file.read())  # Parse in-memory buffer instead of many small stream reads
+        _yaml_cache[file_path] = (stat.st_mtime_ns, stat.st_size, content)
+
+    return utilns.wrap_namespace(content)
 
 
 def copy_resource(src: Path, dst: Path, overwrite=False):
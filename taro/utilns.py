@@ -1,4 +1,4 @@
-import functools
+from functools import lru_cache
 from types import SimpleNamespace
 
 
@@ -17,24 +17,27 @@ class NestedNamespace(SimpleNamespace):
 
 
 def get_attr(obj, fields, default=None, type_=None, allowed=()):
-    val = _getattr(obj, fields.split('.'), default, type_)
+    val = _getattr(obj, _split_fields(fields), default, type_)
     if allowed and val not in allowed:
         raise ValueError(f"Value `{val}` for `{fields}` is not in allowed values: {allowed}")
     return val
 
 
-def _getattr(obj, fields, default, type_):
-    attr = getattr(obj, fields[0], default)
+@lru_cache(maxsize=256)
+def _split_fields(fields):
+    return tuple(fields.split('.'))
 
-    if attr is None:
-        return default
 
-    if len(fields) == 1:
-        if attr is not None and type_ and not isinstance(attr, type_):
-            raise TypeError(f"{attr} is not instance of {type_}")
-        return attr
-    else:
-        return _getattr(attr, fields[1:], default, type_)
+def _getattr(obj, fields, default, type_):
+    attr = obj
+    for field in fields:
+        attr = getattr(attr, field, default)
+        if attr is None:
+            return default
+
+    if type_ and not isinstance(attr, type_):
+        raise TypeError(f"{attr} is not instance of {type_}")
+    return attr
 
 
 # Martijn Pieters' solution below: https://stackoverflow.com/questions/50490856
@@ -42,25 +45,19 @@ def wrap_namespace(ob) -> NestedNamespace:
     return _wrap_namespace(ob) or NestedNamespace()
 
 
-@functools.singledispatch
-def _wrap_namespace(ob) -> NestedNamespace:
+def _wrap_namespace(ob):
     """Converts provided dictionary and all dictionaries in its value trees to nested namespace.
 
     This allows to access nested fields using chained dot notation: value = ns.top.nested
     """
+    # Plain type checks are used as there are only two cases; singledispatch has notable overhead per each call
+    if isinstance(ob, dict):
+        return NestedNamespace(**{k: _wrap_namespace(v) for k, v in ob.items()})
+    if isinstance(ob, list):
+        return [_wrap_namespace(v) for v in ob]
     return ob
 
 
-@_wrap_namespace.register(dict)
-def _wrap_dict(ob):
-    return NestedNamespace(**{k: _wrap_namespace(v) for k, v in ob.items()})
-
-
-@_wrap_namespace.register(list)
-def _wrap_list(ob):
-    return [_wrap_namespace(v) for v in ob]
-
-
 def set_attr(obj, fields, value):
     if len(fields) == 1:
         setattr(obj, fields[0], value)
@@ -33,7 +33,7 @@ _log_levels = ['critical', 'fatal', 'error', 'warn', 'warning', 'info', 'debug',
 def parse_args(args):
     # TODO destination required
     parser = argparse.ArgumentParser(description='Manage your jobs with Taro')
-    parser.add_argument("-V", "--version", action='version', help="Show version and exit.", version=version.get())   
+    parser.add_argument("-V", "--version", action=_VersionAction, help="Show version and exit.")
     common = argparse.ArgumentParser()  # parent parser for subparsers in case they need to share common options
     common.add_argument('--set', type=str, action='append', help='override value of configuration field')
     subparsers = parser.add_subparsers(dest='action')  # command/action
@@ -345,3 +345,16 @@ def _check_collisions(parser, parsed):
 
     if len(config_options) > 1:
         parser.error('Conflicting options: ' + str(config_options))
+
+
+class _VersionAction(argparse.Action):
+    """
+    Like the standard 'version' action but the version is resolved only when the option is used
+    """
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS, help=None):
+        super().__init__(option_strings=option_strings, dest=dest, default=default, nargs=0, help=help)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        print(version.get())
+        parser.exit()
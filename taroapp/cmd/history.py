@@ -6,13 +6,15 @@ from taroapp.view import instance as view_inst
 
 
 def run(args):
-    jobs = persistence.read_jobs(id_=args.id, sort=SortCriteria[args.sort.upper()], asc=args.asc,
-                                 limit=args.lines or -1, last=args.last)
+    # The pager reads the output in its own thread, but the database connection can be used only by this thread
+    read_jobs = persistence.iter_jobs if args.no_pager else persistence.read_jobs
+    jobs = read_jobs(id_=args.id, sort=SortCriteria[args.sort.upper()], asc=args.asc,
+                     limit=args.lines or -1, last=args.last)
 
     columns = [view_inst.JOB_ID, view_inst.INSTANCE_ID, view_inst.CREATED, view_inst.ENDED, view_inst.EXEC_TIME,
                view_inst.STATE, view_inst.WARNINGS, view_inst.RESULT]
     job_filter = _build_job_filter(args)
-    filtered_jobs = filter(job_filter, jobs)
+    filtered_jobs = filter(job_filter, jobs) if job_filter.filters else jobs
     ps.print_table(filtered_jobs, columns, _colours, show_header=True, pager=not args.no_pager)
 
 
@@ -21,7 +23,7 @@ def _build_job_filter(args):
     if args.id:
         job_filter <<= jfilter.create_id_filter(args.id)
     if args.today:
-        job_filter <<= jfilter.today_filter
+        job_filter <<= jfilter.create_today_filter()
     if args.since:
         job_filter <<= jfilter.create_since_filter(args.since)
     if args.until:
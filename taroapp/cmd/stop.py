@@ -7,8 +7,7 @@ from taroapp.view.instance import JOB_ID, INSTANCE_ID, CREATED, STATE
 
 def run(args):
     with JobsClient() as client:
-        all_jobs = client.read_jobs_info()
-        jobs = [job for job in all_jobs if job.matches(args.instance)]
+        jobs = client.read_jobs_info(args.instance)  # Matching is done by the instances
 
         if not jobs:
             print('No such instance to stop: ' + args.instance)
@@ -1,5 +1,4 @@
 import signal
-from fnmatch import fnmatch
 
 import taro.client
 from taro import JobInfo
@@ -15,9 +14,7 @@ def run(args):
         signal.signal(signal.SIGINT, lambda _, __: receiver.close())
         receiver.start()
     else:
-        for job_id, instance_id, tail in taro.client.read_tail(None):
-            if args.instance and not (fnmatch(job_id, args.instance) or fnmatch(instance_id, args.instance)):
-                continue
+        for job_id, instance_id, tail in taro.client.read_tail(args.instance):
             print(job_id + "@" + instance_id + ':')
             for line in tail:
                 print(line)
@@ -30,17 +30,24 @@ def finished_filter(job_info):
     return job_info.state.is_terminal()
 
 
-def today_filter(job_info):
-    return job_info.lifecycle.changed(ExecutionState.CREATED).astimezone().date() == \
-           datetime.datetime.today().date()
+def create_today_filter():
+    today = datetime.date.today()
+
+    def do_filter(job_info):
+        return job_info.lifecycle.changed(ExecutionState.CREATED).astimezone().date() == today
+
+    return do_filter
 
 
 def create_since_filter(since):
+    since_local = since.astimezone()  # Naive `since` is local time, made aware once to compare with aware UTC times
+
     def do_filter(job_info):
-        return job_info.lifecycle.changed(ExecutionState.CREATED).astimezone().replace(tzinfo=None) >= since
+        return job_info.lifecycle.changed(ExecutionState.CREATED) >= since_local
 
     return do_filter
 
 
 def create_until_filter(until):
-    return lambda j: not create_since_filter(until)(j)
+    since_filter = create_since_filter(until)
+    return lambda j: not since_filter(j)
@@ -39,8 +39,9 @@ def output_gen(items, columns: List[Column], colours, show_header: bool, stretch
         First 50 rows are examined to find optimal width of the columns
     """
     job_iter = iter(items)
-    first_fifty = list(itertools.islice(job_iter, 50))
-    column_widths = _calc_widths(first_fifty, columns, stretch_last_column)
+    # Column values are evaluated only once for each item as they are used for both the widths and the lines
+    first_fifty = [(item, [c.value_fnc(item) for c in columns]) for item in itertools.islice(job_iter, 50)]
+    column_widths = _calc_widths([values for _, values in first_fifty], columns, stretch_last_column)
     f = " ".join(" {:" + str(w - 1) + "}" for w in column_widths)
 
     if show_header:
@@ -49,17 +50,18 @@ def output_gen(items, columns: List[Column], colours, show_header: bool, stretch
         separator_line = " ".join("-" * w for w in column_widths)
         yield FTxt([('bold', separator_line)])
 
-    for item in itertools.chain(first_fifty, job_iter):
-        line = f.format(*(_limit_text(c.value_fnc(item), column_widths[i] - 2) for i, c in enumerate(columns)))
+    remaining = ((item, [c.value_fnc(item) for c in columns]) for item in job_iter)
+    for item, values in itertools.chain(first_fifty, remaining):
+        line = f.format(*(_limit_text(value, column_widths[i] - 2) for i, value in enumerate(values)))
         colour = colours(item) if colours else ''
         yield FTxt([(colour, line)])
 
 
-def _calc_widths(items, columns: List[Column], stretch_last_column: bool):
+def _calc_widths(rows, columns: List[Column], stretch_last_column: bool):
     widths = [len(c.name) + 2 for c in columns]  # +2 for left and right padding
-    for item in items:
-        for i, column in enumerate(columns):
-            widths[i] = max(widths[i], min(len(column.value_fnc(item)) + 2, column.max_width))
+    for values in rows:
+        for i, value in enumerate(values):
+            widths[i] = max(widths[i], min(len(value) + 2, columns[i].max_width))
 
     # vv Add spare terminal length to the last column vv
     try:
@@ -73,7 +75,7 @@ def _calc_widths(items, columns: List[Column], stretch_last_column: bool):
         if stretch_last_column:
             widths[-1] += spare_length
         else:
-            max_length_in_last_column = max((len(columns[-1].value_fnc(i)) + 2 for i in items), default=(widths[-1]))
+            max_length_in_last_column = max((len(values[-1]) + 2 for values in rows), default=(widths[-1]))
 
             if max_length_in_last_column < widths[-1] + spare_length:
                 widths[-1] = max_length_in_last_column
@@ -107,11 +109,11 @@ def parse_table(output, columns) -> List[Dict[Column, str]]:
     """
 
     lines = [line for line in output.splitlines() if line]  # Ignore empty lines
-    header_idx = [i for i, line in enumerate(lines) if all(column.name in line for column in columns)]
-    if not header_idx:
+    header_idx = next((i for i, line in enumerate(lines) if all(column.name in line for column in columns)), None)
+    if header_idx is None:
         raise ValueError('The output does not contain specified job table')
-    column_sep_line = lines[header_idx[0] + 1]  # Line separating header and values..
+    column_sep_line = lines[header_idx + 1]  # Line separating header and values..
     sep_line_pattern = re.compile('-+')  # ..consisting of `-` strings for each column
     column_spans = [column.span() for column in sep_line_pattern.finditer(column_sep_line)]
     return [dict(zip(columns, (line[slice(*span)].strip() for span in column_spans)))
-            for line in lines[header_idx[0] + 2:]]
+            for line in lines[header_idx + 2:]]
@@ -1,5 +1,4 @@
-import pkg_resources  # part of setuptools
-
 def get():
+    import pkg_resources  # part of setuptools; imported here as it is slow to load and rarely needed
     version = pkg_resources.require("taro")[0].version
-    return version
\ No newline at end of file
+    return version
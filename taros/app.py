@@ -9,6 +9,11 @@ from taro.jobs.execution import ExecutionState
 from taro.jobs.persistence import SortCriteria
 from taros.httputil import http_error, query_digit, query
 
+try:
+    import orjson  # Optional faster JSON implementation
+except ImportError:
+    orjson = None
+
 
 @route('/instances')
 def instances():
@@ -60,6 +65,8 @@ def resource_job_info(job_info):
 
 
 def to_json(d):
+    if orjson:
+        return orjson.dumps(d, option=orjson.OPT_INDENT_2)
     return json.dumps(d, indent=2)
 
 
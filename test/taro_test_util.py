@@ -1,3 +1,4 @@
+import time
 from multiprocessing.context import Process
 from pathlib import Path
 from typing import Dict, Tuple
@@ -9,6 +10,7 @@ from prompt_toolkit.output import DummyOutput
 from taroapp import main
 from taro import paths, JobInfo, Warn, WarningObserver, cfg
 from taro.jobs import program
+from taro.jobs.events import STATE_LISTENER_FILE_EXTENSION
 from taro.jobs.job import WarnEventCtx
 
 
@@ -56,7 +58,16 @@ def run_wait(state, count=1) -> Process:
     :param count: number of waits
     :return: the app as a process
     """
-    return run_app_as_process("wait -c {} -s {}".format(count, state.name))
+    listeners = set(paths.socket_files(STATE_LISTENER_FILE_EXTENSION))
+    wait_app = run_app_as_process("wait -c {} -s {}".format(count, state.name))
+    _wait_for_new_socket(STATE_LISTENER_FILE_EXTENSION, listeners)  # Events sent before the socket exists are lost
+    return wait_app
+
+
+def _wait_for_new_socket(file_extension, existing, timeout=2):
+    deadline = time.monotonic() + timeout
+    while not set(paths.socket_files(file_extension)) - existing and time.monotonic() < deadline:
+        time.sleep(0.01)
 
 
 def run_app_as_process_and_wait(command, *, wait_for, timeout=2, daemon=False, shell=False) -> Process:
@@ -90,8 +101,10 @@ def remove_test_config():
 
 def remove_test_db():
     test_db = test_db_path()
-    if test_db.exists():
-        test_db.unlink()
+    # WAL journal mode leaves -wal and -shm side files next to the database
+    for path in (test_db, test_db.with_name(test_db.name + '-wal'), test_db.with_name(test_db.name + '-shm')):
+        if path.exists():
+            path.unlink()
 
 
 def _test_config_path() -> Path:
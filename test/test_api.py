@@ -0,0 +1,25 @@
+"""
+Tests :mod:`api` module through the client
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from taro.client import JobsClient
+from taro.jobs.api import Server
+
+
+@pytest.fixture
+def server():
+    server = Server(SimpleNamespace(job_id='test_api_job', instance_id='test_api_inst'), None)
+    assert server.start()
+    yield server
+    server.close()
+
+
+def test_read_instance_ids(server):
+    with JobsClient() as client:
+        assert ('test_api_job', 'test_api_inst') in client.read_instance_ids()
+        assert client.read_instance_ids('test_api_job') == [('test_api_job', 'test_api_inst')]
+        assert client.read_instance_ids('test_api_i*') == [('test_api_job', 'test_api_inst')]
+        assert client.read_instance_ids('test_api_other') == []
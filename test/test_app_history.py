@@ -0,0 +1,65 @@
+"""
+Tests :mod:`app` module
+Command: history
+"""
+from datetime import datetime, timedelta, timezone
+from threading import Thread
+
+import pytest
+
+import taroapp.view.instance as view_inst
+from taro import cfg, JobInfo
+from taro.jobs import persistence
+from taro.jobs.execution import ExecutionLifecycle, ExecutionState
+from taroapp import ps
+from taro_test_util import run_app, test_db_path, remove_test_db
+
+
+@pytest.fixture(autouse=True)
+def persisted_jobs():
+    cfg.persistence_enabled = True
+    cfg.persistence_type = 'sqlite'
+    cfg.persistence_database = str(test_db_path())
+    created = datetime(2020, 1, 1, 10, 0, tzinfo=timezone.utc)
+    lifecycle = ExecutionLifecycle((ExecutionState.CREATED, created),
+                                   (ExecutionState.COMPLETED, created + timedelta(seconds=1)))
+    persistence.store_jobs([JobInfo('j1', 'i1', lifecycle, None, {}, None),
+                            JobInfo('j2', 'i2', lifecycle, None, {}, None)])
+    persistence.close()
+    yield
+    remove_test_db()
+
+
+class ThreadedPager:
+    """Reads the sources in a separate thread like the real pager does"""
+
+    def __init__(self):
+        self.sources = []
+
+    def add_source(self, source):
+        self.sources.append(source)
+
+    def run(self):
+        reader = Thread(target=self._read)
+        reader.start()
+        reader.join()
+
+    def _read(self):
+        for source in self.sources:
+            while not source.eof():
+                print(''.join(text for _, text in source.read_chunk()), end='')
+
+
+def test_history_with_pager(capsys, monkeypatch):
+    monkeypatch.setattr(ps, 'Pager', ThreadedPager)
+    run_app('history')
+
+    jobs = ps.parse_table(capsys.readouterr().out, [view_inst.JOB_ID, view_inst.INSTANCE_ID])
+    assert [job[view_inst.INSTANCE_ID] for job in jobs] == ['i2', 'i1']
+
+
+def test_history_without_pager(capsys):
+    run_app('history -P')
+
+    jobs = ps.parse_table(capsys.readouterr().out, [view_inst.JOB_ID, view_inst.INSTANCE_ID])
+    assert [job[view_inst.INSTANCE_ID] for job in jobs] == ['i2', 'i1']
@@ -53,3 +53,11 @@ def test_not_str_type_raises_error():
     create_test_config({"log": {"stdout": {"level": 3}}})  # Non-str value
     with pytest.raises(TypeError):
         cfgfile.load()
+
+
+def test_modified_config_reloaded():
+    create_test_config({"plugins": "p1"})
+    cfgfile.load()
+    create_test_config({"plugins": ["p1", "p2"]})
+    cfgfile.load()
+    assert cfg.plugins == ("p1", "p2")
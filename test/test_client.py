@@ -0,0 +1,73 @@
+"""
+Tests :mod:`client` module shared client
+"""
+import pytest
+
+import taro
+import taro.client
+
+
+class FakeJobsClient:
+    created = []
+
+    def __init__(self):
+        self.closed = False
+        self.error = None
+        FakeJobsClient.created.append(self)
+
+    def read_jobs_info(self, instance=""):
+        if self.error:
+            raise self.error
+        return []
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def fake_client(monkeypatch):
+    FakeJobsClient.created = []
+    monkeypatch.setattr(taro.client, 'JobsClient', FakeJobsClient)
+    yield
+    taro.client.close_client()
+
+
+def test_client_reused():
+    taro.client.read_jobs_info()
+    taro.client.read_jobs_info()
+
+    assert len(FakeJobsClient.created) == 1
+    assert not FakeJobsClient.created[0].closed
+
+
+def test_close_client():
+    taro.client.read_jobs_info()
+    taro.client.close_client()
+
+    assert FakeJobsClient.created[0].closed
+    assert taro.client._client is None
+
+    taro.client.read_jobs_info()
+    assert len(FakeJobsClient.created) == 2
+
+
+def test_taro_close_closes_client():
+    taro.client.read_jobs_info()
+    taro.close()
+
+    assert FakeJobsClient.created[0].closed
+    assert taro.client._client is None
+
+
+@pytest.mark.parametrize('error', [OSError('socket error'), KeyboardInterrupt()])
+def test_client_discarded_on_error(error):
+    taro.client.read_jobs_info()
+    FakeJobsClient.created[0].error = error
+
+    with pytest.raises(type(error)):
+        taro.client.read_jobs_info()
+
+    assert FakeJobsClient.created[0].closed
+    assert taro.client._client is None
+    taro.client.read_jobs_info()
+    assert len(FakeJobsClient.created) == 2
@@ -0,0 +1,11 @@
+from taro.jobs.job import id_matches
+
+
+def test_id_matches():
+    assert id_matches('job', 'instance', 'job')
+    assert id_matches('job', 'instance', 'instance')
+    assert id_matches('job', 'instance', 'j*')
+    assert id_matches('job', 'instance', '*stan*')
+    assert not id_matches('job', 'instance', 'jo')
+    assert not id_matches('job', 'instance', 'Job')
+    assert id_matches('job[1]', 'instance', 'job[[]1]')
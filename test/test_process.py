@@ -1,14 +1,16 @@
 """
 Tests :mod:`process` module
 """
+import io
+import sys
 from multiprocessing import Pipe
-from threading import Thread
+from threading import Thread, Lock
 from time import sleep
 
 import pytest
 
 from taro import ExecutionState, ExecutionError
-from taro.jobs.process import ProcessExecution
+from taro.jobs.process import ProcessExecution, _CapturingWriter, _STOP_FRAME
 
 
 def test_exec():
@@ -75,3 +77,113 @@ def test_interrupt():
 def interrupt_after(sec, execution):
     sleep(sec)
     execution.interrupt()
+
+
+class FakeConnection:
+
+    def __init__(self):
+        self.frames = []
+
+    def send_bytes(self, buf):
+        self.frames.append(buf)
+
+
+def test_writer_sends_complete_lines():
+    out = io.StringIO()
+    conn = FakeConnection()
+    writer = _CapturingWriter(out, conn, Lock())
+
+    writer.write('first\nsec')
+    assert conn.frames == [b'first']
+    writer.write('ond\nthi')
+    assert conn.frames == [b'first', b'second']
+
+    writer.flush()
+    assert conn.frames == [b'first', b'second', b'thi']
+    assert out.getvalue() == 'first\nsecond\nthi'
+
+
+def test_writer_never_sends_stop_frame():
+    conn = FakeConnection()
+    writer = _CapturingWriter(io.StringIO(), conn, Lock())
+
+    writer.write('\n  \n\t\n')
+    writer.write('   ')
+    writer.flush()
+    assert conn.frames == []
+
+
+def test_writer_keeps_lines_of_threads_separated():
+    conn = FakeConnection()
+    writer = _CapturingWriter(io.StringIO(), conn, Lock())
+
+    def write(thread):
+        for i in range(500):
+            writer.write(f"t{thread}-")  # Unfinished line, completed by the next write
+            writer.write(f"line-{i}\n")
+        writer.write(f"t{thread}-end")
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # Switch threads as often as possible
+    try:
+        threads = [Thread(target=write, args=(t,)) for t in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+    writer.flush_all()
+
+    expected = [f"t{t}-line-{i}".encode() for t in range(4) for i in range(500)] + \
+               [f"t{t}-end".encode() for t in range(4)]
+    assert sorted(conn.frames) == sorted(expected)
+
+
+def test_read_line_longer_than_buffer():
+    e = ProcessExecution(exec_hello, ())
+    output = []
+    e.add_output_observer(output.append)
+    long_line = 'x' * (65536 * 2)
+
+    def send():  # Sent from another thread as the pipe buffer can be smaller than the line
+        e._output_tx.send_bytes(long_line.encode())
+        e._output_tx.send_bytes(b'short')
+        e._output_tx.send_bytes(_STOP_FRAME)
+
+    sender = Thread(target=send)
+    sender.start()
+    e._read_output()
+    sender.join()
+
+    assert output == [long_line, 'short']
+
+
+def test_output_from_threads():
+    e = ProcessExecution(exec_print_from_threads, ())
+    output = []
+    e.add_output_observer(output.append)
+
+    assert e.execute() == ExecutionState.COMPLETED
+    assert sorted(output) == sorted(f"t{t}-line-{i}" for t in range(4) for i in range(300))
+
+
+def exec_print_from_threads():
+    sys.setswitchinterval(1e-6)  # Switch threads as often as possible
+
+    def print_lines(thread):
+        for i in range(300):
+            print(f"t{thread}-line-{i}")
+
+    threads = [Thread(target=print_lines, args=(t,)) for t in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+def test_read_output_ends_on_closed_pipe():
+    e = ProcessExecution(exec_hello, ())
+    e._output_tx.close()
+
+    e._read_output()  # Must return instead of raising EOFError
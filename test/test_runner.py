@@ -4,6 +4,7 @@ Tests :mod:`runner` module
 import time
 from threading import Thread
 
+import taro.client
 import taro.jobs.runner as runner
 from taro.jobs.execution import ExecutionState as ExSt, ExecutionError
 from taro.jobs.program import ProgramExecution
@@ -25,6 +26,22 @@ def test_state_changes():
     assert instance.lifecycle.states() == [ExSt.CREATED, ExSt.RUNNING, ExSt.COMPLETED]
 
 
+def test_no_overlap_skipped(monkeypatch):
+    monkeypatch.setattr(taro.client, 'read_instance_ids', lambda: [('j', 'running_instance')])
+    execution = TestExecution()
+
+    instance = runner.run('j', execution, no_overlap=True)
+    assert instance.lifecycle.state() == ExSt.SKIPPED
+    assert execution.executed_count() == 0
+
+
+def test_no_overlap_other_job_running(monkeypatch):
+    monkeypatch.setattr(taro.client, 'read_instance_ids', lambda: [('other_job', 'running_instance')])
+
+    instance = runner.run('j', TestExecution(), no_overlap=True)
+    assert instance.lifecycle.state() == ExSt.COMPLETED
+
+
 def test_state_created():
     instance = RunnerJobInstance('j', TestExecution())
     assert instance.lifecycle.state() == ExSt.CREATED
@@ -47,6 +64,66 @@ def test_pending():
     assert instance.lifecycle.states() == [ExSt.CREATED, ExSt.PENDING, ExSt.RUNNING, ExSt.COMPLETED]
 
 
+def test_instance_observers_changed_between_notifications():
+    instance = RunnerJobInstance('j', TestExecution())
+    removed, added = [], []
+    instance.add_state_observer(lambda info: removed.append(info.state))
+
+    def change_observers():
+        instance.remove_state_observer(instance._state_observers[0])
+        instance.add_state_observer(lambda info: added.append(info.state))
+
+    run_with_observers_changed_when_pending(instance, removed, change_observers)
+
+    assert removed == [ExSt.PENDING]
+    assert added == [ExSt.RUNNING, ExSt.COMPLETED]
+
+
+def test_global_observers_changed_between_notifications():
+    instance = RunnerJobInstance('j', TestExecution())
+    removed, added = [], []
+
+    def removed_observer(info):
+        removed.append(info.state)
+
+    def added_observer(info):
+        added.append(info.state)
+
+    runner.register_state_observer(removed_observer)
+
+    def change_observers():
+        runner.deregister_state_observer(removed_observer)
+        runner.register_state_observer(added_observer)
+
+    try:
+        run_with_observers_changed_when_pending(instance, removed, change_observers)
+    finally:
+        runner.deregister_state_observer(added_observer)
+
+    assert removed == [ExSt.PENDING]
+    assert added == [ExSt.RUNNING, ExSt.COMPLETED]
+
+
+def run_with_observers_changed_when_pending(instance, notified, change_observers):
+    """
+    Run the instance and change the observers after the pending state notification and before the following ones
+    """
+    latch = instance.create_latch(ExSt.PENDING)
+    t = Thread(target=instance.run)
+    t.start()
+
+    wait_count = 0
+    while not notified:  # The pending notification populates the cache of the notify functions
+        time.sleep(0.01)
+        wait_count += 1
+        if wait_count > 100:
+            assert False, 'Pending state notification not received'
+
+    change_observers()
+    latch()
+    t.join(timeout=1)
+
+
 def test_cancellation_after_start():  # TODO unreliable test relying on timing (stopped before latch fully released)?
     instance = RunnerJobInstance('j', TestExecution())
     latch = instance.create_latch(ExSt.PENDING)
@@ -88,6 +165,17 @@ def test_error():
     assert instance.exec_error.unexpected_error == exception
 
 
+def test_info_lifecycle_updated_on_state_change():
+    instance = RunnerJobInstance('j', TestExecution())
+    created_info = instance.create_info()
+    assert created_info.lifecycle.states() == [ExSt.CREATED]
+
+    instance.run()
+
+    assert created_info.lifecycle.states() == [ExSt.CREATED]
+    assert instance.create_info().lifecycle.states() == [ExSt.CREATED, ExSt.RUNNING, ExSt.COMPLETED]
+
+
 def wait_for_pending_state(instance: RunnerJobInstance):
     """
     Wait for the job to reach waiting state
@@ -106,4 +194,4 @@ def test_last_output():
     instance = RunnerJobInstance('j', execution)
     execution.add_output_observer(instance)
     instance.run()
-    assert instance.last_output == "1 everyone in the world is doing something without me".split()
+    assert instance.last_output == tuple("1 everyone in the world is doing something without me".split())
@@ -0,0 +1,96 @@
+"""
+Tests :mod:`sqlite` persistence using an in-memory database
+"""
+import sqlite3
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from taro.jobs.db import sqlite
+from taro.jobs.db.sqlite import SQLite
+from taro.jobs.execution import ExecutionState, ExecutionLifecycle
+from taro.jobs.job import JobInfo
+from taro.jobs.persistence import SortCriteria
+
+_start = datetime(2020, 1, 1, 10, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(params=[True, False], ids=['window', 'group_by'])
+def db(request, monkeypatch):
+    monkeypatch.setattr(sqlite, '_WINDOW_FUNCTIONS', request.param)
+    sqlite_ = SQLite(sqlite3.connect(':memory:'))
+    sqlite_.check_tables_exist()
+    yield sqlite_
+    sqlite_.close()
+
+
+def job(job_id, instance_id, minute):
+    created = _start + timedelta(minutes=minute)
+    lifecycle = ExecutionLifecycle(
+        (ExecutionState.CREATED, created),
+        (ExecutionState.RUNNING, created + timedelta(seconds=1)),
+        (ExecutionState.COMPLETED, created + timedelta(seconds=2)))
+    return JobInfo(job_id, instance_id, lifecycle, 'status', {'warn': 1}, None)
+
+
+def read(db, **kwargs):
+    params = dict(id_=None, sort=SortCriteria.CREATED, asc=True, limit=-1, last=False)
+    params.update(kwargs)
+    return [j.instance_id for j in db.read_jobs(**params)]
+
+
+def test_store_jobs(db):
+    db.store_jobs([job('j1', 'i1', 0), job('j2', 'i2', 1), job('j1', 'i3', 2)])
+    db.store_job(job('j3', 'i4', 3))
+
+    assert read(db) == ['i1', 'i2', 'i3', 'i4']
+    assert read(db, asc=False) == ['i4', 'i3', 'i2', 'i1']
+
+    stored = db.read_jobs(id_='i2', sort=SortCriteria.CREATED, asc=True, limit=-1, last=False)[0]
+    assert stored.job_id == 'j2'
+    assert stored.state == ExecutionState.COMPLETED
+    assert stored.lifecycle.changed(ExecutionState.CREATED) == _start + timedelta(minutes=1)
+    assert stored.warnings == {'warn': 1}
+
+
+def test_limit(db):
+    db.store_jobs([job('j1', 'i1', 0), job('j2', 'i2', 1), job('j3', 'i3', 2)])
+
+    assert read(db, limit=2) == ['i1', 'i2']
+    assert read(db, limit=2, asc=False) == ['i3', 'i2']
+
+
+def test_last(db):
+    db.store_jobs([job('j1', 'i1', 0), job('j2', 'i2', 1), job('j1', 'i3', 2), job('j2', 'i4', 3)])
+
+    assert read(db, last=True) == ['i3', 'i4']
+    assert read(db, last=True, limit=1, asc=False) == ['i4']
+
+
+def test_id_same_as_column_name(db):
+    db.store_jobs([job('created', 'i1', 0), job('j2', 'i2', 1), job('j3', 'finished', 2)])
+
+    assert read(db, id_='created') == ['i1']
+    assert read(db, id_='finished') == ['finished']
+    assert read(db, id_='j2', last=True) == ['i2']
+
+
+def test_close_when_locked(tmp_path):
+    db_file = str(tmp_path / 'locked.db')
+    sqlite_ = SQLite(sqlite3.connect(db_file))
+    sqlite_.check_tables_exist()
+    sqlite_.store_job(job('j1', 'i1', 0))
+
+    other = sqlite3.connect(db_file, isolation_level=None)
+    other.execute('BEGIN EXCLUSIVE')  # Holds the lock needed by `PRAGMA optimize`
+    try:
+        started = time.monotonic()
+        sqlite_.close()
+        assert time.monotonic() - started < 2
+    finally:
+        other.execute('ROLLBACK')
+        other.close()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        sqlite_.read_jobs(id_=None, sort=SortCriteria.CREATED, asc=True, limit=-1, last=False)  # Closed
@@ -0,0 +1,31 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from taro import util
+
+
+@pytest.fixture(params=[True, False], ids=['fromisoformat', 'strptime'])
+def parse_path(request, monkeypatch):
+    if not request.param:
+        monkeypatch.setattr(util, '_fromisoformat', None)
+
+
+def test_dt_from_utc_str(parse_path):
+    expected = datetime(2020, 1, 1, 10, 0, 0, 123456, tzinfo=timezone.utc)
+    assert util.dt_from_utc_str('2020-01-01T10:00:00.123456+00:00') == expected
+    assert util.dt_from_utc_str('2020-01-01 10:00:00.123456+00:00', is_iso=False) == expected
+    assert util.dt_from_utc_str('2020-01-01T11:00:00.123456+0100') == expected
+
+
+def test_dt_from_utc_str_without_fraction(parse_path):
+    expected = datetime(2020, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
+    assert util.dt_from_utc_str('2020-01-01T10:00:00+00:00') == expected
+    assert util.dt_from_utc_str('2020-01-01 10:00:00+00:00', is_iso=False) == expected
+
+
+def test_dt_from_utc_str_requires_timezone(parse_path):
+    assert util.dt_from_utc_str('') is None
+    with pytest.raises(ValueError):
+        util.dt_from_utc_str('2020-01-01T10:00:00.123456')
+